@@ -1,7 +1,6 @@
 import streamlit as st
-import pandas as pd
-import time
-from utils import load_recipes, filter_recipes, format_recipe_details
+from pathlib import Path
+from utils import load_browse_recipes, cached_filter_recipes, compute_filter_options, get_recipe_detail_html, _RECIPE_CSS
 
 # Page configuration
 st.set_page_config(
@@ -10,68 +9,66 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
-    <style>
-    .main {
-        padding: 2rem;
-    }
-    .stButton > button {
-        width: 100%;
-    }
-    .recipe-grid {
-        display: grid;
-        grid-template-columns: repeat(2, 1fr) !important;
-        gap: 1.5rem;
-        margin: 1rem 0;
-        width: 100%;
-    }
-    @media (max-width: 768px) {
-        .recipe-grid {
-            grid-template-columns: 1fr !important;
-        }
-    }
-    .recipe-card {
-        background-color: #f0f2f6;
-        padding: 1.5rem;
-        border-radius: 5px;
-        margin-bottom: 1rem;
-        width: 100%;
-        box-sizing: border-box;
-    }
-    .recipe-header {
-        margin-bottom: 1rem;
-    }
-    .recipe-actions {
-        display: grid;
-        grid-template-columns: 3fr 1fr;
-        gap: 1rem;
-        align-items: center;
-        margin-top: 1rem;
-    }
-    .category-tag {
-        display: inline-block;
-        padding: 0.2rem 0.5rem;
-        margin: 0.2rem;
-        border-radius: 15px;
-        background-color: #e1e1e1;
-        font-size: 0.8rem;
-    }
-    button[type="secondary"] {
-        background-color: #FFD700 !important;
-        border: none !important;
-        padding: 0.5rem !important;
-        font-size: 24px !important;
-        color: black !important;
-        border-radius: 4px !important;
-        transition: transform 0.2s !important;
-    }
-    button[type="secondary"]:hover {
-        background-color: #FFB400 !important;
-        transform: scale(1.05) !important;
-    }
-    </style>
-""", unsafe_allow_html=True)
+# Custom CSS, kept in styles.css and read once at import time
+PAGE_CSS = "<style>" + Path(__file__).with_name('styles.css').read_text() + "</style>"
+
+st.markdown(PAGE_CSS, unsafe_allow_html=True)
+
+def toggle_favorite(recipe_id):
+    """Flip a recipe's favorite state and toast the result. Single
+    mutation point for the favorites set."""
+    if recipe_id in st.session_state.favorites:
+        st.session_state.favorites.remove(recipe_id)
+        st.toast("Removed from favorites!", icon="\u2716\ufe0f")
+    else:
+        st.session_state.favorites.add(recipe_id)
+        st.toast("Added to favorites!", icon="\u2b50")
+
+@st.fragment
+def recipe_actions(recipe):
+    """Per-recipe action row. Runs as a fragment so a favorite toggle only
+    reruns this block instead of re-filtering and re-rendering the page."""
+    is_favorite = recipe['id'] in st.session_state.favorites
+    favorite_icon = "★" if is_favorite else "☆"
+    name_col, fav_col = st.columns([3, 1])
+    with name_col:
+        st.caption(recipe['name'])
+    with fav_col:
+        if st.button(favorite_icon, key=recipe['fav_key'], help="Add/Remove from favorites", type="secondary"):
+            toggle_favorite(recipe['id'])
+            st.rerun(scope="fragment")
+
+def render_sidebar(recipes_df):
+    """Render the sidebar filters and return the selected filter values."""
+    st.sidebar.title("Recipe Filters")
+
+    if not recipes_df.empty:
+        # Grouping the inputs in a form means a rerun (and hence a filter
+        # pass) only fires on Apply, not on every keystroke or selection
+        with st.sidebar.form("filters"):
+            search_term = st.text_input("Search recipes", "")
+
+            # Difficulty and category filters (options are cached per dataset)
+            difficulties, categories_list = compute_filter_options()
+            selected_difficulty = st.selectbox("Select Difficulty", difficulties)
+            selected_category = st.selectbox("Select Category", categories_list)
+
+            # Favorites filter
+            show_favorites = st.checkbox("Show Favorites Only")
+
+            st.form_submit_button("Apply")
+
+        # Update favorites count display
+        if show_favorites:
+            total_favorites = int(recipes_df['id'].isin(st.session_state.favorites).sum())
+            st.sidebar.markdown(f"💝 **{total_favorites} recipes** in favorites")
+    else:
+        search_term = ""
+        selected_difficulty = None
+        selected_category = None
+        show_favorites = False
+
+    return search_term, selected_difficulty, selected_category, show_favorites
 
 # Initialize session state
 if 'page_number' not in st.session_state:
@@ -80,117 +77,85 @@ if 'page_number' not in st.session_state:
 if 'favorites' not in st.session_state:
     st.session_state.favorites = set()
 
-if 'viewing_recipe' not in st.session_state:
-    st.session_state.viewing_recipe = None
-
-if 'prev_show_favorites' not in st.session_state:
-    st.session_state.prev_show_favorites = False
-
-# Load recipes
-if 'recipes_df' not in st.session_state:
-    with st.spinner('Loading recipes...'):
-        try:
-            st.session_state.recipes_df = load_recipes()
-        except FileNotFoundError as e:
-            st.error(str(e))
-            st.info("Please add recipe JSON files to the 'data/recipe' directory to get started.")
-            st.stop()
-        except ValueError as e:
-            st.error(str(e))
-            st.info("Please ensure your recipe JSON files contain all required fields.")
-            st.stop()
-        except Exception as e:
-            st.error(f"An unexpected error occurred: {str(e)}")
-            st.stop()
+# Load recipes (the loader is memoized with st.cache_data, so the parsed
+# DataFrame is shared across sessions instead of re-read per browser session)
+try:
+    recipes_df = load_browse_recipes('data/recipe')
+except FileNotFoundError as e:
+    st.error(str(e))
+    st.info("Please add recipe JSON files to the 'data/recipe' directory to get started.")
+    st.stop()
+except ValueError as e:
+    st.error(str(e))
+    st.info("Please ensure your recipe JSON files contain all required fields.")
+    st.stop()
+except Exception as e:
+    st.error(f"An unexpected error occurred: {str(e)}")
+    st.stop()
 
 # Main title
 st.title("🍳 Recipe Browser")
 
+# The viewed recipe travels in the URL (?recipe=<id>) instead of session
+# state: only a few bytes per rerun, and detail views become shareable links
+viewing_id = None
+if 'recipe' in st.query_params:
+    try:
+        viewing_id = int(st.query_params['recipe'])
+    except ValueError:
+        st.query_params.pop('recipe', None)
+
 # Recipe detail view
-if st.session_state.viewing_recipe is not None:
-    recipe = st.session_state.viewing_recipe
+if viewing_id is not None:
     
     # Back and favorite buttons
     col1, col2 = st.columns([4, 1])
     
     with col1:
         if st.button("← Back to Recipes", type="primary"):
-            st.session_state.viewing_recipe = None
+            st.query_params.pop('recipe', None)
             st.rerun()
     
     with col2:
-        is_favorite = recipe['id'] in st.session_state.favorites
+        is_favorite = viewing_id in st.session_state.favorites
         favorite_icon = "★" if is_favorite else "☆"
         if st.button(favorite_icon, key="detail_favorite", help="Add/Remove from favorites", type="secondary"):
-            if recipe['id'] in st.session_state.favorites:
-                st.session_state.favorites.remove(recipe['id'])
-                message = "Removed from favorites!"
-                icon = "✖️"
-            else:
-                st.session_state.favorites.add(recipe['id'])
-                message = "Added to favorites!"
-                icon = "⭐"
-            st.toast(message, icon=icon)
-            time.sleep(1.5)
+            toggle_favorite(viewing_id)
             st.rerun()
     
     st.markdown("---")
     
-    # Recipe details
-    recipe_dict = recipe.to_dict() if isinstance(recipe, pd.Series) else recipe
-    st.markdown(format_recipe_details(recipe_dict), unsafe_allow_html=True)
+    # Recipe details (formatted once per id, then served from cache); the
+    # static detail styling is a module constant emitted alongside
+    try:
+        st.markdown(_RECIPE_CSS + get_recipe_detail_html(viewing_id), unsafe_allow_html=True)
+    except KeyError:
+        st.warning("Recipe not found.")
 
 else:
-    # Sidebar filters
-    st.sidebar.title("Recipe Filters")
-    
-    # Search box
-    search_term = st.sidebar.text_input("Search recipes", "")
-    
-    # Difficulty filter
-    if not st.session_state.recipes_df.empty:
-        difficulties = ["All"] + sorted(st.session_state.recipes_df['difficulty'].unique().tolist())
-        selected_difficulty = st.sidebar.selectbox("Select Difficulty", difficulties)
-    
-        # Category filter
-        all_categories = set()
-        for categories in st.session_state.recipes_df['categories']:
-            all_categories.update(categories)
-        categories_list = ["All"] + sorted(list(all_categories))
-        selected_category = st.sidebar.selectbox("Select Category", categories_list)
-    
-        # Favorites filter
-        show_favorites = st.sidebar.checkbox("Show Favorites Only")
-        
-        # Reset page number when toggling favorites
-        if show_favorites != st.session_state.prev_show_favorites:
-            st.session_state.page_number = 1
-            st.session_state.prev_show_favorites = show_favorites
-        
-        # Update favorites count display
-        if show_favorites:
-            total_favorites = len([r for _, r in st.session_state.recipes_df.iterrows() 
-                                 if r['id'] in st.session_state.favorites])
-            st.sidebar.markdown(f"💝 **{total_favorites} recipes** in favorites")
-    else:
-        selected_difficulty = None
-        selected_category = None
-        show_favorites = False
+    search_term, selected_difficulty, selected_category, show_favorites = render_sidebar(recipes_df)
+
+    # Jump back to the first page whenever the active filters change, so a
+    # narrower result set never starts on an out-of-range page
+    filter_key = (search_term, selected_difficulty, selected_category, show_favorites)
+    if st.session_state.get('last_filter_key') != filter_key:
+        st.session_state.page_number = 1
+        st.session_state.last_filter_key = filter_key
 
-    # Apply filters
-    filtered_recipes, total_pages = filter_recipes(
-        st.session_state.recipes_df,
+    # Apply filters (memoized; the frozenset makes the favorites part of
+    # the cross-session cache key)
+    filtered_recipes, total_pages = cached_filter_recipes(
         search_term,
         selected_difficulty,
         selected_category,
         show_favorites,
-        st.session_state.favorites,
+        frozenset(st.session_state.favorites),
         st.session_state.page_number,
         per_page=10  # Limit to 10 items per page
     )
 
     # Recipe grid view
-    if not st.session_state.recipes_df.empty and (
+    if not recipes_df.empty and (
         'filtered_recipes' not in locals() or filtered_recipes.empty
     ):
         if search_term or (selected_difficulty and selected_difficulty != "All") or (selected_category and selected_category != "All") or show_favorites:
@@ -198,82 +163,20 @@ else:
         else:
             st.info("No recipes available. Please add some recipes to get started.")
     else:
-        # Display recipes in a grid using columns
-        for i in range(0, len(filtered_recipes), 2):
-            col1, col2 = st.columns(2)
-            
-            # First recipe in the pair
-            with col1:
-                recipe = filtered_recipes.iloc[i]
-                category_tags = ''.join([f'<span class="category-tag">{cat}</span>' for cat in recipe['categories']])
-                is_favorite = recipe['id'] in st.session_state.favorites
-                favorite_icon = "★" if is_favorite else "☆"
-                
-                st.markdown(f"""
-                    <div class="recipe-card">
-                        <div class="recipe-header">
-                            <h3>{recipe['name']}</h3>
-                            <p>⏱️ {recipe['preview_data']['cook_time']} | 📊 {recipe['difficulty']}</p>
-                            <p>{category_tags}</p>
-                        </div>
-                    </div>
-                """, unsafe_allow_html=True)
-                
-                view_col1, fav_col1 = st.columns([3, 1])
-                with view_col1:
-                    if st.button("View Details", key=f"view_{recipe['id']}_1"):
-                        st.session_state.viewing_recipe = recipe
-                        st.rerun()
-                with fav_col1:
-                    if st.button(favorite_icon, key=f"fav_{recipe['id']}_1", help="Add/Remove from favorites", type="secondary"):
-                        if recipe['id'] in st.session_state.favorites:
-                            st.session_state.favorites.remove(recipe['id'])
-                            message = "Removed from favorites!"
-                            icon = "✖️"
-                        else:
-                            st.session_state.favorites.add(recipe['id'])
-                            message = "Added to favorites!"
-                            icon = "⭐"
-                        st.toast(message, icon=icon)
-                        time.sleep(1.5)
-                        st.rerun()
-            
-            # Second recipe in the pair (if available)
-            if i + 1 < len(filtered_recipes):
-                with col2:
-                    recipe = filtered_recipes.iloc[i + 1]
-                    category_tags = ''.join([f'<span class="category-tag">{cat}</span>' for cat in recipe['categories']])
-                    is_favorite = recipe['id'] in st.session_state.favorites
-                    favorite_icon = "★" if is_favorite else "☆"
-                    
-                    st.markdown(f"""
-                        <div class="recipe-card">
-                            <div class="recipe-header">
-                                <h3>{recipe['name']}</h3>
-                                <p>⏱️ {recipe['preview_data']['cook_time']} | 📊 {recipe['difficulty']}</p>
-                                <p>{category_tags}</p>
-                            </div>
-                        </div>
-                    """, unsafe_allow_html=True)
-                    
-                    view_col2, fav_col2 = st.columns([3, 1])
-                    with view_col2:
-                        if st.button("View Details", key=f"view_{recipe['id']}_2"):
-                            st.session_state.viewing_recipe = recipe
-                            st.rerun()
-                    with fav_col2:
-                        if st.button(favorite_icon, key=f"fav_{recipe['id']}_2", help="Add/Remove from favorites", type="secondary"):
-                            if recipe['id'] in st.session_state.favorites:
-                                st.session_state.favorites.remove(recipe['id'])
-                                message = "Removed from favorites!"
-                                icon = "✖️"
-                            else:
-                                st.session_state.favorites.add(recipe['id'])
-                                message = "Added to favorites!"
-                                icon = "⭐"
-                            st.toast(message, icon=icon)
-                            time.sleep(1.5)
-                            st.rerun()
+        # Card markup is precomputed in the loader (card_html column); the
+        # whole page goes out as a single markdown payload and the
+        # .recipe-grid rules in PAGE_CSS lay it out in two columns
+        st.markdown('<div class="recipe-grid">' + ''.join(filtered_recipes['card_html']) + '</div>',
+                    unsafe_allow_html=True)
+
+        # Per-recipe actions below the grid; plain dict records avoid boxing
+        # every row into a Series like iterrows() does
+        col1, col2 = st.columns(2)
+        for column, half in ((col1, filtered_recipes.iloc[::2]),
+                             (col2, filtered_recipes.iloc[1::2])):
+            with column:
+                for recipe in half.to_dict('records'):
+                    recipe_actions(recipe)
 
         # Pagination
         if total_pages > 1:
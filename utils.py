@@ -1,19 +1,116 @@
 import json
+import numpy as np
 import pandas as pd
 import os
+import sys
 import glob
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Set
-import hashlib
+import zlib
 import streamlit as st
 import re
+from html import escape
+
+try:
+    # Optional: Rust-based JSON parser, several times faster than stdlib json
+    # on the cold-load path; its JSONDecodeError subclasses json's
+    import orjson
+except ImportError:
+    orjson = None
+
+def _parquet_cache_fresh(cache_path: str, fingerprint: tuple) -> bool:
+    """Check whether the Parquet cache was written for exactly this set of
+    source files; comparing the stored fingerprint (sorted paths + mtimes)
+    also catches deleted files and files added with an old mtime, which a
+    plain is-the-cache-newer check misses"""
+    try:
+        with open(_cache_meta_path(cache_path), 'rb') as f:
+            stored = json.loads(f.read())
+    except (OSError, ValueError):
+        return False
+    return stored == [list(entry) for entry in fingerprint]
+
+def _cache_meta_path(cache_path: str) -> str:
+    return cache_path + '.meta.json'
+
+def _dir_fingerprint(data_dir: str) -> tuple:
+    """Fingerprint the data directory (file paths + mtimes) for cache keys"""
+    return tuple(sorted(
+        (path, os.path.getmtime(path))
+        for path in glob.glob(os.path.join(data_dir, '*.json'))))
+
+# Fields every recipe must carry to be loadable
+_REQUIRED_FIELDS = frozenset({'name', 'difficulty', 'prep_time', 'cook_time',
+                              'servings', 'ingredients', 'instructions'})
+
+# Columns the grid and filters actually touch; the heavy detail payload
+# (ingredients, instructions, ...) stays behind get_recipe_details
+_BROWSE_COLUMNS = ['id', 'name', 'name_lower', 'ingredients_blob', 'difficulty',
+                   'categories', 'card_html', 'cook_time', 'prep_min',
+                   'cook_min', 'fav_key']
 
-@st.cache_data
 def load_recipes(data_dir: str = 'data/recipe') -> pd.DataFrame:
     """
     Load recipes from all JSON files in the data/recipe directory and convert to DataFrame
-    Cached using st.cache_data for better performance
+    Thin wrapper that fingerprints the directory (file paths + mtimes) so the
+    cached DataFrame is rebuilt when a recipe file changes, not served stale
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    return _load_recipes_impl(data_dir, _dir_fingerprint(data_dir))
+
+def load_browse_recipes(data_dir: str = 'data/recipe') -> pd.DataFrame:
+    """
+    Lean projection of the recipe DataFrame for browsing and filtering
+    Plain column selection over the cached full frame, so reruns never carry
+    the detail payload through the grid path
     """
-    all_recipes = []
+    return load_recipes(data_dir)[_BROWSE_COLUMNS]
+
+@st.cache_data(show_spinner=False)
+def _recipe_details_impl(data_dir: str, fingerprint: tuple) -> Dict[int, Dict]:
+    df = _load_recipes_impl(data_dir, fingerprint)
+    detail_cols = ['id', 'name', 'difficulty', 'categories', 'prep_time',
+                   'cook_time', 'servings', 'ingredients', 'instructions', 'url']
+    return {record['id']: record for record in df[detail_cols].to_dict('records')}
+
+def get_recipe_details(recipe_id: int, data_dir: str = 'data/recipe') -> Dict:
+    """Fetch the full detail dict for a single recipe by id"""
+    return _recipe_details_impl(data_dir, _dir_fingerprint(data_dir))[recipe_id]
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _recipe_detail_html_impl(data_dir: str, fingerprint: tuple, recipe_id: int) -> str:
+    return format_recipe_details(_recipe_details_impl(data_dir, fingerprint)[recipe_id])
+
+def get_recipe_detail_html(recipe_id: int, data_dir: str = 'data/recipe') -> str:
+    """Formatted detail HTML for a recipe, cached by id so revisiting a
+    recipe skips the markdown assembly entirely; the fingerprint in the
+    key drops stale renders when a source file changes"""
+    return _recipe_detail_html_impl(data_dir, _dir_fingerprint(data_dir), recipe_id)
+
+def _read_recipe_file(file_path: str):
+    """Read and JSON-parse a single recipe file (runs on a worker thread);
+    returns (file_path, parsed_data, error_message)"""
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return file_path, data, None
+    except json.JSONDecodeError:
+        return file_path, None, f"Could not read {file_path} - the file contains invalid JSON format"
+    except Exception as e:
+        return file_path, None, f"Error processing {file_path}: {str(e)}"
+
+@st.cache_data(show_spinner="Loading recipes...")
+def _load_recipes_impl(data_dir: str, fingerprint: tuple) -> pd.DataFrame:
+    """
+    Do the actual load; fingerprint only participates in the cache key
+    """
+    # Column-oriented accumulation: one list per output column lets
+    # pandas assemble the frame without re-inferring dtypes across a list
+    # of per-row dicts
+    columns = {name: [] for name in (
+        'id', 'name', 'difficulty', 'categories', 'prep_time', 'cook_time',
+        'servings', 'ingredients', 'instructions', 'url')}
     seen_ids = set()
     warnings = []
     
@@ -27,83 +124,167 @@ def load_recipes(data_dir: str = 'data/recipe') -> pd.DataFrame:
                 "To get started, add your recipe JSON files to this folder."
             )
 
-        for file_path in json_files:
+        # Cold-start fast path: read the columnar cache instead of re-parsing
+        # every JSON file, as long as no source file is newer than the cache
+        cache_path = os.path.join(data_dir, '.recipes_cache.parquet')
+        if _parquet_cache_fresh(cache_path, fingerprint):
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
+                return pd.read_parquet(cache_path)
+            except Exception:
+                pass  # unreadable/stale cache; fall through to a full rebuild
+
+        # Route files to their parser up front instead of re-deriving the
+        # schema from the basename inside the merge loop
+        filipino_files = {
+            path for path in json_files
+            if os.path.basename(path).lower().startswith('filipino_recipes_page_')}
+
+        # Read and parse files concurrently (the parse is I/O-interleaved and
+        # orjson releases the GIL); merging and ID dedup stay serial below so
+        # semantics match the old sequential loop
+        with ThreadPoolExecutor(max_workers=min(8, len(json_files))) as executor:
+            parsed_files = list(executor.map(_read_recipe_file, json_files))
+
+        for file_path, data, error in parsed_files:
+            if error is not None:
+                warnings.append(error)
+                continue
+            try:
+                is_filipino = file_path in filipino_files
+                
+                recipes = data if isinstance(data, list) else data.get('recipes', [])
+                if not isinstance(recipes, list):
+                    recipes = [recipes]
+                
+                for recipe in recipes:
+                    if not isinstance(recipe, dict):
+                        warnings.append(f"Skipped invalid recipe format in {file_path}")
+                        continue
                     
-                    is_filipino = 'filipino_recipes_page_' in os.path.basename(file_path).lower()
+                    if is_filipino:
+                        recipe = parse_filipino_recipe(recipe)
                     
-                    recipes = data if isinstance(data, list) else data.get('recipes', [])
-                    if not isinstance(recipes, list):
-                        recipes = [recipes]
+                    missing_fields = _REQUIRED_FIELDS - recipe.keys()
                     
-                    for recipe in recipes:
-                        if not isinstance(recipe, dict):
-                            warnings.append(f"Skipped invalid recipe format in {file_path}")
-                            continue
-                        
-                        if is_filipino:
-                            recipe = parse_filipino_recipe(recipe)
-                        
-                        required_fields = ['name', 'difficulty', 'prep_time', 'cook_time', 
-                                       'servings', 'ingredients', 'instructions']
-                        missing_fields = [field for field in required_fields if field not in recipe]
-                        
-                        if missing_fields:
-                            warnings.append(
-                                f"Recipe '{recipe.get('name', 'Unknown')}' in {file_path} "
-                                f"is missing required fields: {', '.join(missing_fields)}"
-                            )
-                            continue
-
-                        if 'categories' not in recipe:
-                            recipe['categories'] = []
-
-                        recipe_id = recipe.get('id')
-                        if recipe_id is None:
-                            recipe_id = generate_unique_id(recipe, seen_ids)
-                            recipe['id'] = recipe_id
-                            warnings.append(
-                                f"Auto-generated ID {recipe_id} for recipe '{recipe['name']}' "
-                                f"in {file_path}"
-                            )
-                        elif recipe_id in seen_ids:
-                            new_id = generate_unique_id(recipe, seen_ids)
-                            warnings.append(
-                                f"Found duplicate ID {recipe_id} for recipe '{recipe['name']}' "
-                                f"in {file_path}. Assigned new ID: {new_id}"
-                            )
-                            recipe['id'] = new_id
-                            recipe_id = new_id
-                            
-                        seen_ids.add(recipe_id)
-                        all_recipes.append({
-                            'id': recipe['id'],
-                            'name': recipe['name'],
-                            'difficulty': recipe['difficulty'],
-                            'categories': recipe['categories'],
-                            'preview_data': recipe
-                        })
+                    if missing_fields:
+                        warnings.append(
+                            f"Recipe '{recipe.get('name', 'Unknown')}' in {file_path} "
+                            f"is missing required fields: {', '.join(sorted(missing_fields))}"
+                        )
+                        continue
+
+                    # Normalize categories here so no downstream consumer
+                    # needs per-row type checks; interned tuples mean the
+                    # handful of distinct category strings are shared across
+                    # all rows instead of duplicated per recipe
+                    categories = recipe.get('categories', [])
+                    if not isinstance(categories, (list, tuple)):
+                        categories = [categories]
+                    recipe['categories'] = tuple(sys.intern(str(c)) for c in categories)
+
+                    # Normalize IDs to ints so favorites membership and isin
+                    # never compare int and str keys for the same recipe
+                    recipe_id = recipe.get('id')
+                    if isinstance(recipe_id, str) and recipe_id.isdigit():
+                        recipe_id = int(recipe_id)
+                        recipe['id'] = recipe_id
+                    if not isinstance(recipe_id, int):
+                        recipe_id = generate_unique_id(recipe, seen_ids)
+                        recipe['id'] = recipe_id
+                        warnings.append(
+                            f"Auto-generated ID {recipe_id} for recipe '{recipe['name']}' "
+                            f"in {file_path}"
+                        )
+                    elif recipe_id in seen_ids:
+                        new_id = generate_unique_id(recipe, seen_ids)
+                        warnings.append(
+                            f"Found duplicate ID {recipe_id} for recipe '{recipe['name']}' "
+                            f"in {file_path}. Assigned new ID: {new_id}"
+                        )
+                        recipe['id'] = new_id
+                        recipe_id = new_id
                         
-            except json.JSONDecodeError:
-                warnings.append(f"Could not read {file_path} - the file contains invalid JSON format")
+                    seen_ids.add(recipe_id)
+                    recipe.setdefault('url', '')
+                    for name, values in columns.items():
+                        values.append(recipe[name])
+                    
             except Exception as e:
                 warnings.append(f"Error processing {file_path}: {str(e)}")
 
-        if not all_recipes:
+        if not columns['id']:
             raise ValueError(
                 "No valid recipes found. Please ensure your recipe files are in the correct format "
                 "and contain all required fields."
             )
 
-        df = pd.DataFrame(all_recipes)
-        
+        df = pd.DataFrame(columns, copy=False)
+        df['id'] = df['id'].astype('int64')
+
+        # Servings arrive as a mix of ints and strings depending on the
+        # source file; normalize to a consistent string column
+        df['servings'] = df['servings'].astype(str)
+
+        # Difficulty has a handful of distinct values; categorical codes make
+        # unique()/equality filters cheap and shrink the column's memory
+        df['difficulty'] = df['difficulty'].astype('category')
+
+        # Parse the time strings ("30 minutes", "1 hour", ...) into compact
+        # int16 minute columns once, so any duration filtering is a plain
+        # integer compare; the original strings are kept for display
+        for src, dst in (('prep_time', 'prep_min'), ('cook_time', 'cook_min')):
+            minutes = df[src].astype(str).str.extract(r'(\d+)', expand=False)
+            minutes = pd.to_numeric(minutes, errors='coerce').fillna(0)
+            df[dst] = minutes.astype('int16') * df[src].astype(str).str.contains(
+                'hour', case=False).map({True: 60, False: 1}).astype('int16')
+
+        # Precompute the lowercased names once so the search filter doesn't
+        # re-lowercase the whole column on every keystroke
+        df['name_lower'] = df['name'].str.lower()
+
+        # Flatten each ingredient list into one lowercased blob (\x01 keeps
+        # entries from matching across boundaries) so ingredient search is a
+        # single C-level substring scan instead of a per-row Python loop
+        df['ingredients_blob'] = df['ingredients'].str.join('\x01').str.lower()
+
+        # Precompute the category-tag HTML once so the render loop doesn't
+        # rebuild it for every visible card on every rerun
+        df['categories_html'] = df['categories'].map(
+            lambda cats: ''.join(f'<span class="category-tag">{cat}</span>' for cat in cats))
+
+        id_str = df['id'].astype(str)
+
+        # Assemble the complete card markup per recipe with vectorized
+        # string concat, so rendering a page is just ''.join over a column;
+        # the View link targets the ?recipe= query param directly, so cards
+        # need no Streamlit button at all
+        df['card_html'] = (
+            '<div class="recipe-card"><div class="recipe-header">'
+            '<h3>' + df['name'] + '</h3>'
+            '<p>\u23f1\ufe0f ' + df['cook_time'].astype(str) +
+            ' | \U0001f4ca ' + df['difficulty'].astype(str) + '</p>'
+            '<p>' + df['categories_html'] + '</p>'
+            '<a class="view-link" href="?recipe=' + id_str +
+            '" target="_self">View Details</a>'
+            '</div></div>'
+        )
+
+        # Widget keys are stable per recipe; building them once here saves
+        # the per-card f-string work on every rerun
+        df['fav_key'] = 'fav_' + id_str
+
+        try:
+            df.to_parquet(cache_path)
+            with open(_cache_meta_path(cache_path), 'w') as f:
+                json.dump([list(entry) for entry in fingerprint], f)
+        except Exception as e:
+            warnings.append(f"Could not write recipe cache {cache_path}: {str(e)}")
+
         if warnings:
             print("\nRecipe Loading Summary:")
             for warning in warnings:
                 print(f"- {warning}")
-            print(f"\nSuccessfully loaded {len(all_recipes)} valid recipes.")
+            print(f"\nSuccessfully loaded {len(df)} valid recipes.")
                 
         return df
 
@@ -112,16 +293,21 @@ def load_recipes(data_dir: str = 'data/recipe') -> pd.DataFrame:
 
 def generate_unique_id(recipe: Dict, seen_ids: set) -> int:
     """Generate a unique ID for a recipe based on its content"""
-    content = f"{recipe['name']}{''.join(recipe['ingredients'])}".encode('utf-8')
-    hash_num = int(hashlib.md5(content).hexdigest(), 16)
-    base_id = (hash_num % 1000000) + 1
-    new_id = base_id
-    
+    # crc32 is plenty for collision avoidance here and skips both the MD5
+    # rounds and the hexdigest -> bignum round-trip; keeping its full 32-bit
+    # range (vs the old % 1000000) makes same-bucket collisions rare enough
+    # that the probe loop below almost never runs
+    # Feed the hasher incrementally so no joined copy of the name and
+    # ingredient strings is ever materialized
+    digest = zlib.crc32(recipe['name'].encode('utf-8'))
+    for ingredient in recipe['ingredients']:
+        digest = zlib.crc32(ingredient.encode('utf-8'), digest)
+    new_id = digest + 1
+
+    # Rare-collision fallback: LCG step through the 32-bit space
     while new_id in seen_ids:
-        new_id += 1
-        if new_id > 1000000:
-            new_id = 1
-    
+        new_id = (new_id * 6364136223846793005 + 1) & 0xFFFFFFFF
+
     return new_id
 
 def parse_filipino_recipe(recipe: Dict) -> Dict:
@@ -135,7 +321,10 @@ def parse_filipino_recipe(recipe: Dict) -> Dict:
         'prep_time': prep_time,
         'cook_time': cook_time,
         'servings': recipe.get('servings', '4'),
-        'ingredients': [ing.replace('▢ ', '') for ing in recipe.get('ingredients', [])],
+        # The containment check skips the fresh-string allocation replace()
+        # would make for the (common) ingredients without the marker
+        'ingredients': [ing.replace('▢ ', '', 1) if '▢ ' in ing else ing
+                        for ing in recipe.get('ingredients', [])],
         'instructions': recipe.get('instructions', []),
         'categories': [recipe.get('category', 'Filipino Dishes')],
         'url': recipe.get('url', '')
@@ -143,97 +332,207 @@ def parse_filipino_recipe(recipe: Dict) -> Dict:
     
     return standardized_recipe
 
-def filter_recipes(df: pd.DataFrame, 
+@st.cache_data(show_spinner=False)
+def _category_index_impl(data_dir: str, fingerprint: tuple) -> Dict[str, np.ndarray]:
+    df = _load_recipes_impl(data_dir, fingerprint)
+    exploded = df['categories'].reset_index(drop=True).explode().dropna()
+    return {category: np.asarray(rows, dtype=np.int64)
+            for category, rows in exploded.groupby(exploded).groups.items()}
+
+def build_category_index(data_dir: str = 'data/recipe') -> Dict[str, np.ndarray]:
+    """
+    Inverted index mapping each category to the positional row indices of
+    the recipes in it, so the category filter touches only matching rows
+    instead of scanning the whole frame
+    Keyed on the directory fingerprint like the loader caches, so the
+    hasher never has to walk (or pickle) the frame itself
+    """
+    return _category_index_impl(data_dir, _dir_fingerprint(data_dir))
+
+@st.cache_data(show_spinner=False)
+def _difficulty_index_impl(data_dir: str, fingerprint: tuple) -> Dict[str, np.ndarray]:
+    df = _load_recipes_impl(data_dir, fingerprint)
+    positions = pd.RangeIndex(len(df))
+    return {str(level): np.asarray(rows, dtype=np.int64)
+            for level, rows in positions.groupby(
+                df['difficulty'].reset_index(drop=True)).items()}
+
+def build_difficulty_index(data_dir: str = 'data/recipe') -> Dict[str, np.ndarray]:
+    """
+    Inverted index mapping each difficulty level to its positional row
+    indices, same shape and cache keying as the category index
+    """
+    return _difficulty_index_impl(data_dir, _dir_fingerprint(data_dir))
+
+@st.cache_data(show_spinner=False)
+def _search_index_impl(data_dir: str, fingerprint: tuple) -> Dict[str, np.ndarray]:
+    df = _load_recipes_impl(data_dir, fingerprint)
+    tokens = (df['name_lower'].str.cat(df['ingredients_blob'], sep='\x01')
+              .str.findall(r'[a-z0-9]+')
+              .reset_index(drop=True).explode().dropna())
+    return {token: np.unique(np.asarray(rows, dtype=np.int64))
+            for token, rows in tokens.groupby(tokens).groups.items()}
+
+def build_search_index(data_dir: str = 'data/recipe') -> Dict[str, np.ndarray]:
+    """
+    Inverted index mapping each whole word from recipe names and
+    ingredients to the positional row indices containing it; the search
+    filter unions matching-token rows, falling back to the vectorized
+    substring scan for terms with non-alphanumeric characters
+    """
+    return _search_index_impl(data_dir, _dir_fingerprint(data_dir))
+
+@st.cache_data
+def _filter_options_impl(data_dir: str, fingerprint: tuple) -> tuple[List[str], List[str]]:
+    df = _load_recipes_impl(data_dir, fingerprint)
+    difficulties = ["All"] + sorted(df['difficulty'].unique().tolist())
+
+    all_categories = df['categories'].explode().dropna().unique()
+    categories_list = ["All"] + sorted(all_categories.tolist())
+
+    return difficulties, categories_list
+
+def compute_filter_options(data_dir: str = 'data/recipe') -> tuple[List[str], List[str]]:
+    """
+    Derive the sidebar filter options (difficulties and categories) from the dataset
+    Cached with st.cache_data so the O(N) scan runs once per dataset, not per rerun
+    """
+    return _filter_options_impl(data_dir, _dir_fingerprint(data_dir))
+
+def filter_recipes(df: pd.DataFrame,
                   search_term: str = "", 
                   difficulty: Optional[str] = None,
                   category: Optional[str] = None,
                   show_favorites: bool = False,
                   favorites: Optional[Set[int]] = None,
                   page: int = 1,
-                  per_page: int = 10) -> tuple[pd.DataFrame, int]:
+                  per_page: int = 10,
+                  data_dir: str = 'data/recipe') -> tuple[pd.DataFrame, int]:
     """
     Filter recipes based on search term, difficulty, category, and favorites
     Returns filtered DataFrame and total number of pages
+    data_dir identifies the dataset for the fingerprint-keyed index caches
     """
     if df.empty:
         return df, 0
 
+    # Common browse path: no filters active, so paging is a direct slice
+    # with no mask work at all
+    if (not search_term and difficulty in (None, "All")
+            and category in (None, "All") and not show_favorites):
+        total_pages = (len(df) + per_page - 1) // per_page
+        start_idx = (page - 1) * per_page
+        return df.iloc[start_idx:start_idx + per_page], total_pages
+
     with st.spinner('Filtering recipes...'):
-        filtered_df = df.copy()
+        # Build one combined boolean mask and slice a single time, instead
+        # of copying the DataFrame and re-slicing it per active filter
+        mask = np.ones(len(df), dtype=bool)
 
         if show_favorites and favorites is not None:
-            filtered_df = filtered_df[filtered_df['id'].isin(favorites)]
-            
+            mask &= df['id'].isin(favorites).to_numpy()
+
         if search_term:
             search_term = search_term.lower()
-            name_mask = filtered_df['name'].str.lower().str.contains(search_term, na=False)
-            filtered_df = filtered_df[name_mask]
+            if re.fullmatch(r'[a-z0-9]+', search_term):
+                # Index tokens are maximal [a-z0-9] runs, so an alphanumeric
+                # term can only ever occur inside a single token; unioning
+                # the rows of every vocabulary token containing the term
+                # reproduces the substring-scan result exactly, while only
+                # scanning the (small) vocabulary instead of every recipe
+                search_mask = np.zeros(len(df), dtype=bool)
+                for token, rows in build_search_index(data_dir).items():
+                    if search_term in token:
+                        search_mask[rows] = True
+                mask &= search_mask
+            else:
+                # regex=False dispatches to a plain C substring scan instead
+                # of compiling the term through the regex engine; a recipe
+                # matches on its name or any of its ingredients
+                mask &= (
+                    df['name_lower'].str.contains(search_term, regex=False, na=False)
+                    | df['ingredients_blob'].str.contains(search_term, regex=False, na=False)
+                ).to_numpy()
 
         if difficulty and difficulty != "All":
-            filtered_df = filtered_df[filtered_df['difficulty'] == difficulty]
+            diff_mask = np.zeros(len(df), dtype=bool)
+            rows = build_difficulty_index(data_dir).get(difficulty)
+            if rows is not None:
+                diff_mask[rows] = True
+            mask &= diff_mask
 
         if category and category != "All":
-            filtered_df = filtered_df[filtered_df['categories'].apply(lambda x: category in x if isinstance(x, list) else False)]
+            cat_mask = np.zeros(len(df), dtype=bool)
+            rows = build_category_index(data_dir).get(category)
+            if rows is not None:
+                cat_mask[rows] = True
+            mask &= cat_mask
 
-        total_recipes = len(filtered_df)
+        # Count matches straight off the mask and materialize only the rows
+        # of the requested page, never the full filtered frame
+        total_recipes = int(mask.sum())
         total_pages = (total_recipes + per_page - 1) // per_page
 
         start_idx = (page - 1) * per_page
-        end_idx = start_idx + per_page
-        paginated_df = filtered_df.iloc[start_idx:end_idx]
+        page_rows = np.flatnonzero(mask)[start_idx:start_idx + per_page]
 
-        return paginated_df, total_pages
+        return df.iloc[page_rows], total_pages
 
-def format_instruction_step(instruction: str) -> str:
-    """Format a single instruction step with periods handling"""
-    parts = []
-    current_part = ""
-    i = 0
-    
-    while i < len(instruction):
-        # Check if we're at a period
-        if instruction[i] == '.':
-            # Look back to check if it's preceded by 'lb' or 'lbs'
-            prev_text = instruction[max(0, i-3):i].lower()
-            if not (prev_text.endswith('lb') or prev_text.endswith('lbs')):
-                # This is a sentence-ending period
-                current_part += '.'
-                parts.append(current_part)
-                current_part = ""
-            else:
-                # This is part of a measurement, keep it with the current part
-                current_part += '.'
-        else:
-            current_part += instruction[i]
-        i += 1
-    
-    # Add any remaining text
-    if current_part:
-        parts.append(current_part)
-    
-    # Format the parts
-    formatted_parts = []
-    for i, part in enumerate(parts):
-        part = part.strip()
-        if not part:  # Skip empty parts
-            continue
-            
-        if i == 0:  # First part (before first period)
-            formatted_parts.append(part)
-        else:  # Subsequent parts (after periods)
-            if not part.endswith('.'):
-                part += '.'
-            formatted_parts.append(f"<br><i>{part}</i>")
-    
-    return ''.join(formatted_parts)
+@st.cache_data(max_entries=128, show_spinner=False)
+def cached_filter_recipes(search_term: str,
+                          difficulty: Optional[str],
+                          category: Optional[str],
+                          show_favorites: bool,
+                          favorites: frozenset,
+                          page: int,
+                          per_page: int = 10) -> tuple[pd.DataFrame, int]:
+    """
+    Memoized front-end for filter_recipes
+    Identical filter tuples (e.g. paging back to an already-seen page) reuse
+    the previous result instead of re-running the pandas filter pipeline
+    The DataFrame is fetched from the cached loader rather than passed in, so
+    the hasher never has to walk the whole frame; favorites must be a
+    frozenset so each distinct set hashes into the shared cache key -
+    st.cache_data is cross-session, so keying on anything less (e.g. a
+    per-session counter) would let one session's favorites page leak into
+    another's
+    """
+    return filter_recipes(load_browse_recipes(), search_term, difficulty, category,
+                          show_favorites, favorites, page, per_page)
 
-def format_recipe_details(recipe: Dict) -> str:
-    """Format recipe details for display with improved layout"""
-    if 'preview_data' in recipe:
-        recipe = recipe['preview_data']
+# Section templates compiled once at import; .format is a single C-level
+# pass per section vs one f-string interpolation per field
+_INFO_TPL = (
+    '<div class="recipe-info">'
+    '<div class="info-item">'
+    '<div class="info-label">Prep Time</div>'
+    '<div class="info-value">{prep_time}</div>'
+    '</div>'
+    '<div class="info-item">'
+    '<div class="info-label">Cook Time</div>'
+    '<div class="info-value">{cook_time}</div>'
+    '</div>'
+    '<div class="info-item">'
+    '<div class="info-label">Servings</div>'
+    '<div class="info-value">{servings}</div>'
+    '</div>'
+    '<div class="info-item">'
+    '<div class="info-label">Difficulty</div>'
+    '<div class="info-value">{difficulty}</div>'
+    '</div>'
+    '</div>'
+)
+_INGREDIENT_TPL = '<div class="ingredient-item">{}</div>'
+_STEP_TPL = (
+    '<div class="instruction-step">'
+    '<div class="step-number">{}</div>'
+    '<div class="step-content">{}</div>'
+    '</div>'
+)
 
-    # Build CSS styles
-    css = """
+# Static styling for the detail view; hoisted to module scope so the
+# formatter never rebuilds it and cached detail HTML stays purely dynamic
+_RECIPE_CSS = """
     <style>
         .recipe-title {
             color: #1f1f1f;
@@ -345,57 +644,86 @@ def format_recipe_details(recipe: Dict) -> str:
             color: #ff7676;
         }
     </style>
-    """
+"""
 
-    # Build HTML sections
-    title_html = f'<div class="recipe-title">{recipe["name"]}</div>'
+def format_instruction_step(instruction: str) -> str:
+    """Format a single instruction step with periods handling"""
+    parts = []
+    current_part = ""
+    i = 0
     
-    categories_html = '<div class="categories-section">'
-    categories_html += ''.join(f'<span class="category-tag">{cat}</span>' 
-                             for cat in recipe.get('categories', []))
-    categories_html += '</div>'
+    while i < len(instruction):
+        # Check if we're at a period
+        if instruction[i] == '.':
+            # Look back to check if it's preceded by 'lb' or 'lbs'
+            prev_text = instruction[max(0, i-3):i].lower()
+            if not (prev_text.endswith('lb') or prev_text.endswith('lbs')):
+                # This is a sentence-ending period
+                current_part += '.'
+                parts.append(current_part)
+                current_part = ""
+            else:
+                # This is part of a measurement, keep it with the current part
+                current_part += '.'
+        else:
+            current_part += instruction[i]
+        i += 1
+    
+    # Add any remaining text
+    if current_part:
+        parts.append(current_part)
+    
+    # Format the parts
+    formatted_parts = []
+    for i, part in enumerate(parts):
+        part = part.strip()
+        if not part:  # Skip empty parts
+            continue
+            
+        if i == 0:  # First part (before first period)
+            formatted_parts.append(part)
+        else:  # Subsequent parts (after periods)
+            if not part.endswith('.'):
+                part += '.'
+            formatted_parts.append(f"<br><i>{part}</i>")
     
-    info_html = (
-        '<div class="recipe-info">'
-        f'<div class="info-item">'
-        f'<div class="info-label">Prep Time</div>'
-        f'<div class="info-value">{recipe["prep_time"]}</div>'
-        '</div>'
-        f'<div class="info-item">'
-        f'<div class="info-label">Cook Time</div>'
-        f'<div class="info-value">{recipe["cook_time"]}</div>'
-        '</div>'
-        f'<div class="info-item">'
-        f'<div class="info-label">Servings</div>'
-        f'<div class="info-value">{recipe["servings"]}</div>'
-        '</div>'
-        f'<div class="info-item">'
-        f'<div class="info-label">Difficulty</div>'
-        f'<div class="info-value">{recipe["difficulty"]}</div>'
-        '</div>'
-        '</div>'
-    )
+    return ''.join(formatted_parts)
+
+def format_recipe_details(recipe: Dict) -> str:
+    """Format recipe details for display with improved layout"""
+    # Build HTML sections
+    title_html = f'<div class="recipe-title">{escape(str(recipe["name"]))}</div>'
     
-    ingredients_html = '<div class="ingredients-section">'
-    ingredients_html += '<h2>Ingredients</h2>'
-    ingredients_html += '<div class="ingredients-grid">'
-    ingredients_html += ''.join(
-        f'<div class="ingredient-item">{ingredient}</div>'
-        for ingredient in recipe['ingredients']
-    )
-    ingredients_html += '</div></div>'
+    categories_html = ''.join((
+        '<div class="categories-section">',
+        *(f'<span class="category-tag">{escape(str(cat))}</span>'
+          for cat in recipe.get('categories', [])),
+        '</div>',
+    ))
     
-    instructions_html = '<div class="instructions-section">'
-    instructions_html += '<h2>Instructions</h2>'
+    info_html = _INFO_TPL.format(
+        prep_time=escape(str(recipe["prep_time"])),
+        cook_time=escape(str(recipe["cook_time"])),
+        servings=escape(str(recipe["servings"])),
+        difficulty=escape(str(recipe["difficulty"])))
+    
+    # Collect pieces in lists and join once, so long recipes don't pay
+    # quadratic reallocation on repeated string +=
+    ingredients_html = ''.join((
+        '<div class="ingredients-section">',
+        '<h2>Ingredients</h2>',
+        '<div class="ingredients-grid">',
+        *(_INGREDIENT_TPL.format(escape(ingredient))
+          for ingredient in recipe['ingredients']),
+        '</div></div>',
+    ))
+
+    instruction_parts = ['<div class="instructions-section">', '<h2>Instructions</h2>']
     for i, instruction in enumerate(recipe['instructions']):
-        formatted_instruction = format_instruction_step(instruction)
-        instructions_html += (
-            f'<div class="instruction-step">'
-            f'<div class="step-number">{i+1}</div>'
-            f'<div class="step-content">{formatted_instruction}</div>'
-            '</div>'
-        )
-    instructions_html += '</div>'
+        instruction_parts.append(_STEP_TPL.format(
+            i + 1, format_instruction_step(escape(instruction))))
+    instruction_parts.append('</div>')
+    instructions_html = ''.join(instruction_parts)
 
     # Add URL section if available
     url_html = ''
@@ -403,11 +731,10 @@ def format_recipe_details(recipe: Dict) -> str:
         url_html = (
             '<div class="recipe-url">'
             '<h2>Original Recipe</h2>'
-            f'<a href="{recipe["url"]}" target="_blank">View original recipe source</a>'
+            f'<a href="{escape(recipe["url"], quote=True)}" target="_blank">View original recipe source</a>'
             '</div>'
         )
     
-    # Combine all sections
-    complete_html = css + title_html + categories_html + info_html + ingredients_html + instructions_html + url_html
-    
-    return complete_html
+    # Combine all sections (styling ships separately via _RECIPE_CSS)
+    return ''.join((title_html, categories_html, info_html,
+                    ingredients_html, instructions_html, url_html))